@@ -1,10 +1,73 @@
+# cython: language_level=3
+import sys
+import warnings
 from dataclasses import dataclass
-from typing import Sequence, Union, Dict, Type
+from typing import Callable, Sequence, Union, Dict, Type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cython
+    _COMPILED = cython.compiled
+except ImportError:
+    _COMPILED = False
+
+try:
+    if _COMPILED:
+        # numba не компилирует функции модуля, собранного Cython.
+        raise ImportError
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Заглушка для окружения без numba: функции остаются обычными."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+_MSG = ('Тип тренировки: {}; '
+        'Длительность: {:.3f} ч.; '
+        'Дистанция: {:.3f} км; '
+        'Ср. скорость: {:.3f} км/ч; '
+        'Потрачено ккал: {:.3f}.')
+_fmt = _MSG.format
+
+
+def _run_cal(k1: float, k2: float, m_in_km: float,
+             speed: float, weight: float, minutes: float) -> float:
+    """Формула калорий для бега."""
+    # Не сворачивать / m_in_km * minutes в * 0.06 * duration:
+    # результат меняется в последнем знаке (383.85 -> 383.84999999999997).
+    return (k1 * speed - k2) * weight / m_in_km * minutes
+
+
+def _walk_cal(k1: float, k2: float, speed: float,
+              weight: float, height: float, minutes: float) -> float:
+    """Формула калорий для спортивной ходьбы."""
+    var_1 = k1 * weight
+    var_2 = speed * speed / height
+    var_3 = k2 * weight
+    return (var_1 + var_2 * var_3) * minutes
+
+
+def _swim_cal(k1: float, k2: float, speed: float, weight: float) -> float:
+    """Формула калорий для плавания."""
+    return (speed + k1) * k2 * weight
 
 
 @dataclass
 class InfoMessage:
-    """Информационное сообщение о тренировке."""
+    """Информационное сообщение о тренировке.
+
+    Устарело: для вывода используйте Training.format_info().
+    """
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -13,16 +76,18 @@ class InfoMessage:
 
     def get_message(self) -> str:
         """Метод возвращает данные о тренировке"""
-        return (f'Тип тренировки: {self.training_type}; '
-                f'Длительность: {self.duration:.3f} ч.; '
-                f'Дистанция: {self.distance:.3f} км; '
-                f'Ср. скорость: {self.speed:.3f} км/ч; '
-                f'Потрачено ккал: {self.calories:.3f}.')
+        return _fmt(self.training_type,
+                    self.duration,
+                    self.distance,
+                    self.speed,
+                    self.calories)
 
 
 class Training:
     """Базовый класс тренировки."""
+    __slots__ = ('_action', '_duration', 'weight', '_distance', '_speed')
 
+    TYPE_NAME: str = 'Training'
     LEN_STEP: float = 0.65  # рас-ние за один шаг или гребок
     M_IN_KM: float = 1000  # из метров в км
     MIN_IN_HOUR: float = 60
@@ -37,27 +102,64 @@ class Training:
         action - кол-во совершеннных действий
         duration - время тренировки [часы]
         weight - вес спортсмена [кг].
+        Дистанция и средняя скорость считаются сразу и пересчитываются
+        при изменении action или duration, поэтому при duration == 0
+        конструктор выбрасывает ZeroDivisionError.
         """
-        self.action = action
-        self.duration = duration
+        self._action = action
+        self._duration = duration
         self.weight = weight
+        self._update()
+
+    @property
+    def action(self) -> int:
+        """Кол-во совершённых действий."""
+        return self._action
+
+    @action.setter
+    def action(self, action: int) -> None:
+        self._action = action
+        self._update()
+
+    @property
+    def duration(self) -> float:
+        """Время тренировки [часы]."""
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration: float) -> None:
+        self._duration = duration
+        self._update()
+
+    def _update(self) -> None:
+        """Пересчитать дистанцию и среднюю скорость."""
+        # LEN_STEP / M_IN_KM не вычисляется заранее: порядок операций
+        # влияет на округление (0.273 -> 0.27299999999999996).
+        self._distance = self._action * self.LEN_STEP / self.M_IN_KM
+        self._speed = self._distance / self._duration
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError
 
     def show_training_info(self) -> InfoMessage:
-        """Вернуть информационное сообщение о выполненной тренировке."""
-        class_name = type(self).__name__
-        duration = self.duration
+        """Вернуть информационное сообщение о выполненной тренировке.
+
+        Устарело: используйте format_info().
+        """
+        warnings.warn('show_training_info() устарел, '
+                      'используйте format_info()',
+                      DeprecationWarning, stacklevel=2)
+        class_name = self.TYPE_NAME
+        duration = self._duration
         distance = self.get_distance()
         speed = self.get_mean_speed()
         calories = self.get_spent_calories()
@@ -68,28 +170,51 @@ class Training:
                            speed,
                            calories)
 
+    def format_info(self) -> str:
+        """Вернуть строку с информацией о выполненной тренировке."""
+        return _fmt(self.TYPE_NAME,
+                    self._duration,
+                    self._distance,
+                    self._speed,
+                    self.get_spent_calories())
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Не наследовать сгенерированный format_info.
+
+        Подкласс может изменить формулу или константы, поэтому
+        получает общий format_info, если не задал свой.
+        """
+        super().__init_subclass__(**kwargs)
+        if ('format_info' not in cls.__dict__
+                and getattr(cls.format_info, '_specialized', False)):
+            cls.format_info = Training.format_info
+
     def hours_to_minutes(self) -> float:
         """Переводит часы в минуты."""
-        return self.MIN_IN_HOUR * self.duration
+        return self.MIN_IN_HOUR * self._duration
 
 
 class Running(Training):
     """Тренировка: бег."""
+    __slots__ = ()
+
+    TYPE_NAME: str = 'Running'
     LEN_STEP: float = 0.65
     K1: float = 18
     K2: float = 20
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.K1 * self.get_mean_speed()
-                - self.K2)
-                * self.weight
-                / Running.M_IN_KM
-                * self.hours_to_minutes())
+        return _run_cal(self.K1, self.K2, self.M_IN_KM,
+                        self._speed, self.weight,
+                        self.MIN_IN_HOUR * self._duration)
 
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
+    __slots__ = ('height',)
+
+    TYPE_NAME: str = 'SportsWalking'
     LEN_STEP: float = 0.65
     K1: float = 0.035
     K2: float = 0.029
@@ -112,15 +237,16 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        var_1 = self.K1 * self.weight
-        var_2 = self.get_mean_speed()**2 // self.height
-        var_3 = self.K2 * self.weight
-        var_4 = self.hours_to_minutes()
-        return ((var_1 + var_2 * var_3) * var_4)
+        return _walk_cal(self.K1, self.K2, self._speed,
+                         self.weight, self.height,
+                         self.MIN_IN_HOUR * self._duration)
 
 
 class Swimming(Training):
     """Тренировка: плавание."""
+    __slots__ = ('_length_pool', '_count_pool')
+
+    TYPE_NAME: str = 'Swimming'
     LEN_STEP: float = 1.38
     K1: float = 1.1
     K2: int = 2
@@ -140,38 +266,248 @@ class Swimming(Training):
         length_pool - длина бассейна [метры]
         count_pool - сколько раз переплыл бассейн.
         """
+        self._length_pool = length_pool
+        self._count_pool = count_pool
         super().__init__(action, duration, weight)
-        self.length_pool = length_pool
-        self.count_pool = count_pool
 
-    def get_mean_speed(self) -> float:
-        """Получить среднюю скорость движения."""
-        return (self.length_pool
-                * self.count_pool
-                / self.M_IN_KM
-                / self.duration)
+    @property
+    def length_pool(self) -> float:
+        """Длина бассейна [метры]."""
+        return self._length_pool
+
+    @length_pool.setter
+    def length_pool(self, length_pool: float) -> None:
+        self._length_pool = length_pool
+        self._update()
+
+    @property
+    def count_pool(self) -> float:
+        """Сколько раз переплыл бассейн."""
+        return self._count_pool
+
+    @count_pool.setter
+    def count_pool(self, count_pool: float) -> None:
+        self._count_pool = count_pool
+        self._update()
+
+    def _update(self) -> None:
+        """Пересчитать дистанцию и среднюю скорость по бассейну."""
+        super()._update()
+        self._speed = (self._length_pool
+                       * self._count_pool
+                       / self.M_IN_KM
+                       / self._duration)
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return (self.get_mean_speed() + self.K1) * self.K2 * self.weight
+        return _swim_cal(self.K1, self.K2, self._speed, self.weight)
+
+
+_WORKOUTS: Dict[str, Type[Training]] = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+}
+
+# Скомпилированные формулы нужны только пакетным ядрам; numba
+# компилирует их при первом вызове, а не при импорте модуля.
+_run_cal_jit = njit(cache=True)(_run_cal)
+_walk_cal_jit = njit(cache=True)(_walk_cal)
+_swim_cal_jit = njit(cache=True)(_swim_cal)
+
+
+@njit(parallel=True, fastmath={'contract', 'reassoc'}, cache=True)
+def _bulk_running(len_step, m_in_km, min_in_hour, k1, k2,
+                  actions, durations, weights):
+    """Ядро пакетного расчёта для бега."""
+    n = actions.shape[0]
+    distances = np.empty(n)
+    speeds = np.empty(n)
+    calories = np.empty(n)
+    for i in prange(n):
+        distances[i] = actions[i] * len_step / m_in_km
+        speeds[i] = distances[i] / durations[i]
+        calories[i] = _run_cal_jit(k1, k2, m_in_km, speeds[i], weights[i],
+                                   min_in_hour * durations[i])
+    return distances, speeds, calories
+
+
+@njit(parallel=True, fastmath={'contract', 'reassoc'}, cache=True)
+def _bulk_sports_walking(len_step, m_in_km, min_in_hour, k1, k2,
+                         actions, durations, weights, heights):
+    """Ядро пакетного расчёта для спортивной ходьбы."""
+    n = actions.shape[0]
+    distances = np.empty(n)
+    speeds = np.empty(n)
+    calories = np.empty(n)
+    for i in prange(n):
+        distances[i] = actions[i] * len_step / m_in_km
+        speeds[i] = distances[i] / durations[i]
+        calories[i] = _walk_cal_jit(k1, k2, speeds[i], weights[i], heights[i],
+                                    min_in_hour * durations[i])
+    return distances, speeds, calories
+
+
+@njit(parallel=True, fastmath={'contract', 'reassoc'}, cache=True)
+def _bulk_swimming(len_step, m_in_km, k1, k2, actions, durations,
+                   weights, length_pools, count_pools):
+    """Ядро пакетного расчёта для плавания."""
+    n = actions.shape[0]
+    distances = np.empty(n)
+    speeds = np.empty(n)
+    calories = np.empty(n)
+    for i in prange(n):
+        distances[i] = actions[i] * len_step / m_in_km
+        speeds[i] = (length_pools[i] * count_pools[i]
+                     / m_in_km / durations[i])
+        calories[i] = _swim_cal_jit(k1, k2, speeds[i], weights[i])
+    return distances, speeds, calories
+
+
+def _as_columns(name: str, *arrays) -> tuple:
+    """Привести данные датчиков к одномерным float64-массивам.
+
+    Второй массив - длительности тренировок. Ядра не проверяют
+    границы, поэтому длины здесь должны совпадать, а длительности
+    быть положительными.
+    """
+    if np is None:
+        raise ImportError(f'{name} требует numpy')
+    columns = tuple(np.asarray(array, dtype=np.float64) for array in arrays)
+    shape = columns[0].shape
+    if len(shape) != 1 or any(column.shape != shape for column in columns):
+        raise ValueError(
+            f'{name}: массивы должны быть одномерными и одной длины'
+        )
+    _check_positive(name, 'длительность должна быть положительной',
+                    columns[1])
+    return columns
+
+
+def _check_positive(name: str, message: str, values) -> None:
+    """Проверить, что делитель в формулах ядра положителен."""
+    if not np.all(values > 0):
+        raise ValueError(f'{name}: {message}')
+
+
+def bulk_running(actions, durations, weights):
+    """Пакетный расчёт для бега.
+
+    Принимает массивы данных датчиков одинаковой длины и возвращает
+    массивы (дистанция, средняя скорость, калории). Требует numpy.
+    """
+    return _bulk_running(Running.LEN_STEP, Running.M_IN_KM,
+                         Running.MIN_IN_HOUR, Running.K1, Running.K2,
+                         *_as_columns('bulk_running',
+                                      actions, durations, weights))
+
+
+def bulk_sports_walking(actions, durations, weights, heights):
+    """Пакетный расчёт для спортивной ходьбы.
+
+    Принимает массивы данных датчиков одинаковой длины и возвращает
+    массивы (дистанция, средняя скорость, калории). Требует numpy.
+    """
+    columns = _as_columns('bulk_sports_walking',
+                          actions, durations, weights, heights)
+    _check_positive('bulk_sports_walking',
+                    'рост должен быть положительным', columns[3])
+    return _bulk_sports_walking(SportsWalking.LEN_STEP,
+                                SportsWalking.M_IN_KM,
+                                SportsWalking.MIN_IN_HOUR,
+                                SportsWalking.K1, SportsWalking.K2,
+                                *columns)
+
+
+def bulk_swimming(actions, durations, weights, length_pools, count_pools):
+    """Пакетный расчёт для плавания.
+
+    Принимает массивы данных датчиков одинаковой длины и возвращает
+    массивы (дистанция, средняя скорость, калории). Требует numpy.
+    """
+    return _bulk_swimming(Swimming.LEN_STEP, Swimming.M_IN_KM,
+                          Swimming.K1, Swimming.K2,
+                          *_as_columns('bulk_swimming',
+                                       actions, durations, weights,
+                                       length_pools, count_pools))
+
+
+def _specialize_swimming(workout: Type[Training]) -> Callable:
+    """Собрать format_info для плавания."""
+    name = workout.TYPE_NAME
+    k1, k2 = workout.K1, workout.K2
+
+    def format_info(self) -> str:
+        speed = self._speed
+        return _fmt(name, self._duration, self._distance, speed,
+                    _swim_cal(k1, k2, speed, self.weight))
+    return format_info
+
+
+def _specialize_running(workout: Type[Training]) -> Callable:
+    """Собрать format_info для бега."""
+    name = workout.TYPE_NAME
+    k1, k2 = workout.K1, workout.K2
+    m_in_km, min_in_hour = workout.M_IN_KM, workout.MIN_IN_HOUR
+
+    def format_info(self) -> str:
+        speed = self._speed
+        duration = self._duration
+        return _fmt(name, duration, self._distance, speed,
+                    _run_cal(k1, k2, m_in_km, speed, self.weight,
+                             min_in_hour * duration))
+    return format_info
+
+
+def _specialize_sports_walking(workout: Type[Training]) -> Callable:
+    """Собрать format_info для спортивной ходьбы."""
+    name = workout.TYPE_NAME
+    k1, k2 = workout.K1, workout.K2
+    min_in_hour = workout.MIN_IN_HOUR
+
+    def format_info(self) -> str:
+        speed = self._speed
+        duration = self._duration
+        return _fmt(name, duration, self._distance, speed,
+                    _walk_cal(k1, k2, speed, self.weight, self.height,
+                              min_in_hour * duration))
+    return format_info
+
+
+_SPECIALIZERS: Dict[str, Callable[[Type[Training]], Callable]] = {
+    'SWM': _specialize_swimming,
+    'RUN': _specialize_running,
+    'WLK': _specialize_sports_walking,
+}
+
+
+def _specialize_format_info() -> None:
+    """Собрать format_info для каждого вида тренировки.
+
+    Название тренировки и константы формулы калорий захватываются
+    замыканием при импорте модуля: после изменения TYPE_NAME, K1, K2,
+    M_IN_KM или MIN_IN_HOUR нужно вызвать эту функцию заново.
+    """
+    for workout_type, workout in _WORKOUTS.items():
+        format_info = _SPECIALIZERS[workout_type](workout)
+        format_info.__qualname__ = f'{workout.__name__}.format_info'
+        format_info.__doc__ = Training.format_info.__doc__
+        format_info._specialized = True
+        workout.format_info = format_info
 
 
 def read_package(workout_type: str,
                  data: Sequence[Union[float, int]]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    dict: Dict[str, Type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-    return dict[workout_type](*data)
+    return _WORKOUTS[workout_type](*data)
+
+
+_specialize_format_info()
 
 
 def main(training: Training) -> None:
     """Главная функция."""
-    info = training.show_training_info()
-    info_message = info.get_message()
-    print(info_message)
+    print(training.format_info())
 
 
 if __name__ == '__main__':
@@ -181,6 +517,7 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    lines = [read_package(workout_type, data).format_info()
+             for workout_type, data in packages]
+    sys.stdout.write('\n'.join(lines))
+    sys.stdout.write('\n')
@@ -1,7 +1,11 @@
 import re
+import copy
+import pickle
+import random
 import pytest
 import types
 import inspect
+from fractions import Fraction
 from conftest import Capturing
 
 try:
@@ -41,6 +45,57 @@ def test_read_package_return(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 0, 80, 25, 40]),
+    ('RUN', [9000, 0, 75]),
+    ('WLK', [9000, 0, 75, 180]),
+])
+def test_read_package_zero_duration(input_data):
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package(*input_data)
+
+
+@pytest.mark.parametrize('input_data, name, value', [
+    (('RUN', [15000, 1, 75]), 'duration', 2),
+    (('RUN', [15000, 1, 75]), 'action', 9000),
+    (('WLK', [9000, 1, 75, 180]), 'duration', 3),
+    (('SWM', [720, 1, 80, 25, 40]), 'duration', 2),
+    (('SWM', [720, 1, 80, 25, 40]), 'length_pool', 50),
+    (('SWM', [720, 1, 80, 25, 40]), 'count_pool', 20),
+])
+def test_read_package_update(input_data, name, value):
+    workout_type, data = input_data
+    training = homework.read_package(workout_type, data)
+    setattr(training, name, value)
+    parameters = list(inspect.signature(type(training)).parameters)
+    data = list(data)
+    data[parameters.index(name)] = value
+    expected = homework.read_package(workout_type, data)
+    assert getattr(training, name) == value
+    assert training.get_distance() == expected.get_distance(), (
+        f'После изменения `{name}` дистанция должна пересчитываться'
+    )
+    assert training.get_mean_speed() == expected.get_mean_speed(), (
+        f'После изменения `{name}` средняя скорость должна пересчитываться'
+    )
+    assert training.get_spent_calories() == (
+        expected.get_spent_calories()
+    ), (
+        f'После изменения `{name}` калории должны пересчитываться'
+    )
+
+
+def test_Running_duration_update():
+    running = homework.Running(15000, 1, 75)
+    running.duration = 2
+    assert running.get_mean_speed() == 4.875, (
+        'После изменения `duration` средняя скорость должна пересчитываться'
+    )
+    assert running.get_spent_calories() == 609.75, (
+        'После изменения `duration` калории должны пересчитываться'
+    )
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         'Проверьте, что `InfoMessage` - это класс.'
@@ -53,6 +108,9 @@ def test_InfoMessage():
             'У метода `__init__` класса `InfoMessage` должен быть '
             f'параметр {p}.'
         )
+    assert not hasattr(info_message('Running', 1, 1, 1, 1), '__dict__'), (
+        'Объявите `__slots__` в классе `InfoMessage`.'
+    )
 
 
 @pytest.mark.parametrize('input_data, expected', [
@@ -102,6 +160,22 @@ def test_InfoMessage_get_message(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('clone', [
+    copy.copy,
+    copy.deepcopy,
+    lambda message: pickle.loads(pickle.dumps(message)),
+])
+def test_InfoMessage_copy(clone):
+    info_message = homework.InfoMessage('Running', 4, 20, 4, 20)
+    result = clone(info_message)
+    assert result == info_message, (
+        'Копия объекта `InfoMessage` должна совпадать с оригиналом.'
+    )
+    assert result.get_message() == info_message.get_message(), (
+        'Копия объекта `InfoMessage` должна возвращать то же сообщение.'
+    )
+
+
 def test_Training():
     assert inspect.isclass(homework.Training), (
         'Проверьте, что `Training` - это класс.'
@@ -129,6 +203,34 @@ def test_Training():
     )
 
 
+def test_Training_slots():
+    training_classes = [homework.Training]
+    for training_class in training_classes:
+        training_classes.extend(training_class.__subclasses__())
+    for training_class in training_classes:
+        if training_class.__module__ != homework.__name__:
+            continue
+        assert '__slots__' in training_class.__dict__, (
+            f'Объявите `__slots__` в классе `{training_class.__name__}`.'
+        )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_read_package_slots(input_data):
+    training = homework.read_package(*input_data)
+    assert not hasattr(training, '__dict__'), (
+        f'Объявите `__slots__` в классе `{type(training).__name__}`, '
+        'чтобы у объектов не было `__dict__`.'
+    )
+    assert not hasattr(homework.Training(720, 1, 80), '__dict__'), (
+        'Объявите `__slots__` в классе `Training`.'
+    )
+
+
 @pytest.mark.parametrize('input_data, expected', [
     ([9000, 1, 75], 5.85),
     ([420, 4, 20], 0.273),
@@ -191,20 +293,105 @@ def test_Training_show_training_info(monkeypatch):
         'Создайте метод `show_training_info` в классе `Training`.'
     )
 
-    def mock_get_spent_calories():
+    def mock_get_spent_calories(self):
         return 100
     monkeypatch.setattr(
-        training,
+        homework.Training,
         'get_spent_calories',
         mock_get_spent_calories
     )
-    result = training.show_training_info()
+    with pytest.warns(DeprecationWarning, match='format_info'):
+        result = training.show_training_info()
     assert result.__class__.__name__ == 'InfoMessage', (
         'Метод `show_training_info` класса `Training` '
         'должен возвращать объект класса `InfoMessage`.'
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_Training_format_info(input_data):
+    training = homework.read_package(*input_data)
+    assert hasattr(training, 'format_info'), (
+        'Создайте метод `format_info` в классе `Training`.'
+    )
+    result = training.format_info()
+    assert isinstance(result, str), (
+        'Метод `format_info` должен возвращать значение типа `str`'
+    )
+    with pytest.warns(DeprecationWarning):
+        expected = training.show_training_info().get_message()
+    assert result == expected, (
+        'Метод `format_info` должен возвращать ту же строку, '
+        'что и `show_training_info().get_message()`'
+    )
+
+
+def test_Training_format_info_subclass_override():
+    class CustomRunning(homework.Running):
+        def get_spent_calories(self):
+            return 1.0
+
+    training = CustomRunning(9000, 1, 75)
+    with pytest.warns(DeprecationWarning):
+        expected = training.show_training_info().get_message()
+    assert training.format_info() == expected, (
+        'Метод `format_info` подкласса должен учитывать '
+        'переопределённый `get_spent_calories`'
+    )
+
+
+@pytest.mark.parametrize('workout_type, args_count', [
+    ('SWM', 5),
+    ('RUN', 3),
+    ('WLK', 4),
+])
+def test_Training_format_info_random(monkeypatch, workout_type, args_count):
+    calls = []
+    monkeypatch.setattr(homework, '_fmt',
+                        lambda *info: calls.append(info) or '')
+    rng = random.Random(workout_type)
+    for _ in range(1000):
+        data = [rng.uniform(0.1, 10000) for _ in range(args_count)]
+        training = homework.read_package(workout_type, data)
+        training.format_info()
+        assert calls.pop() == (
+            training.TYPE_NAME,
+            training.duration,
+            training.get_distance(),
+            training.get_mean_speed(),
+            training.get_spent_calories(),
+        ), (
+            'Метод `format_info` должен выводить те же значения, что '
+            'и `get_distance`, `get_mean_speed` и `get_spent_calories`'
+        )
+
+
+def test_Training_format_info_constant_types(monkeypatch):
+    monkeypatch.setattr(homework.Running, 'K1', Fraction(19))
+    homework._specialize_format_info()
+    try:
+        training = homework.Running(9000, 1, 75)
+        assert training.format_info() == (
+            homework.Training.format_info(training)
+        ), (
+            'Метод `format_info` должен работать с константами любого '
+            'числового типа'
+        )
+    finally:
+        monkeypatch.undo()
+        homework._specialize_format_info()
+
+
+def test_Training_format_info_source():
+    format_info = homework.Running.format_info
+    assert format_info.__module__ == homework.__name__
+    assert 'def format_info' in inspect.getsource(format_info)
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -278,9 +465,9 @@ def test_SportsWalking():
 
 
 @pytest.mark.parametrize('input_data, expected', [
-    ([9000, 1, 75, 180], 157.50000000000003),
-    ([420, 4, 20, 42], 168.00000000000003),
-    ([1206, 12, 6, 12], 151.20000000000002),
+    ([9000, 1, 75, 180], 182.31131250000004),
+    ([420, 4, 20, 42], 168.01543815000002),
+    ([1206, 12, 6, 12], 151.244551192725),
 ])
 def test_SportsWalking_get_spent_calories(input_data, expected):
     sports_walking = homework.SportsWalking(*input_data)
@@ -323,6 +510,110 @@ def test_Running_get_spent_calories(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('bulk_name, workout_type, packages', [
+    ('bulk_running', 'RUN', [[9000, 1, 75], [420, 4, 20], [1206, 12, 6]]),
+    ('bulk_sports_walking', 'WLK',
+        [[9000, 1, 75, 180], [420, 4, 20, 42], [1206, 12, 6, 12]]),
+    ('bulk_swimming', 'SWM',
+        [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4], [1206, 12, 6, 12, 6]]),
+])
+def test_bulk(bulk_name, workout_type, packages):
+    pytest.importorskip('numpy')
+    assert hasattr(homework, bulk_name), (
+        f'Создайте функцию пакетного расчёта `{bulk_name}`.'
+    )
+    distances, speeds, calories = getattr(homework, bulk_name)(
+        *zip(*packages)
+    )
+    for i, data in enumerate(packages):
+        training = homework.read_package(workout_type, data)
+        assert distances[i] == pytest.approx(training.get_distance()), (
+            f'Проверьте расчёт дистанции в `{bulk_name}`'
+        )
+        assert speeds[i] == pytest.approx(training.get_mean_speed()), (
+            f'Проверьте расчёт средней скорости в `{bulk_name}`'
+        )
+        assert calories[i] == pytest.approx(training.get_spent_calories()), (
+            f'Проверьте расчёт калорий в `{bulk_name}`'
+        )
+
+
+@pytest.mark.parametrize(
+    'bulk_name, kernel_name, calories_name, workout_type, packages', [
+        ('bulk_running', '_bulk_running', '_run_cal', 'RUN',
+            [[9000, 1, 75], [420, 4, 20], [1206, 12, 6]]),
+        ('bulk_sports_walking', '_bulk_sports_walking', '_walk_cal', 'WLK',
+            [[9000, 1, 75, 180], [420, 4, 20, 42], [1206, 12, 6, 12]]),
+        ('bulk_swimming', '_bulk_swimming', '_swim_cal', 'SWM',
+            [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4],
+             [1206, 12, 6, 12, 6]]),
+    ]
+)
+def test_bulk_python_fallback(monkeypatch, bulk_name, kernel_name,
+                              calories_name, workout_type, packages):
+    pytest.importorskip('numpy')
+    kernel = getattr(homework, kernel_name)
+    monkeypatch.setattr(homework, kernel_name,
+                        getattr(kernel, 'py_func', kernel))
+    monkeypatch.setattr(homework, f'{calories_name}_jit',
+                        getattr(homework, calories_name))
+    distances, speeds, calories = getattr(homework, bulk_name)(
+        *zip(*packages)
+    )
+    for i, data in enumerate(packages):
+        training = homework.read_package(workout_type, data)
+        assert distances[i] == training.get_distance(), (
+            f'Проверьте расчёт дистанции в `{kernel_name}` без numba'
+        )
+        assert speeds[i] == training.get_mean_speed(), (
+            f'Проверьте расчёт средней скорости в `{kernel_name}` без numba'
+        )
+        assert calories[i] == training.get_spent_calories(), (
+            f'Проверьте расчёт калорий в `{kernel_name}` без numba'
+        )
+
+
+@pytest.mark.parametrize('bulk_name, args', [
+    ('bulk_running', ([9000] * 4, [1], [75])),
+    ('bulk_running', ([9000, 420], [1, 4], [75, 20, 6])),
+    ('bulk_running', ([[9000]], [[1]], [[75]])),
+    ('bulk_sports_walking', ([9000, 420], [1, 4], [75, 20], [180])),
+    ('bulk_swimming', ([720], [1], [80], [25], [40, 40])),
+])
+def test_bulk_length_mismatch(bulk_name, args):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError, match='одной длины'):
+        getattr(homework, bulk_name)(*args)
+
+
+@pytest.mark.parametrize('bulk_name, args', [
+    ('bulk_running', ([9000, 420], [1, 0], [75, 20])),
+    ('bulk_sports_walking', ([9000], [-1], [75], [180])),
+    ('bulk_swimming', ([720], [float('nan')], [80], [25], [40])),
+])
+def test_bulk_non_positive_duration(bulk_name, args):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError, match='длительность'):
+        getattr(homework, bulk_name)(*args)
+
+
+def test_bulk_sports_walking_non_positive_height():
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError, match='рост'):
+        homework.bulk_sports_walking([9000], [1], [75], [0])
+
+
+@pytest.mark.parametrize('bulk_name, args', [
+    ('bulk_running', ([9000], [1], [75])),
+    ('bulk_sports_walking', ([9000], [1], [75], [180])),
+    ('bulk_swimming', ([720], [1], [80], [25], [40])),
+])
+def test_bulk_without_numpy(monkeypatch, bulk_name, args):
+    monkeypatch.setattr(homework, 'np', None)
+    with pytest.raises(ImportError, match='numpy'):
+        getattr(homework, bulk_name)(*args)
+
+
 def test_main():
     assert hasattr(homework, 'main'), (
         'Создайте главную функцию программы с именем `main`.'
@@ -353,7 +644,7 @@ def test_main():
         'Длительность: 1.000 ч.; '
         'Дистанция: 5.850 км; '
         'Ср. скорость: 5.850 км/ч; '
-        'Потрачено ккал: 157.500.'
+        'Потрачено ккал: 182.311.'
     ])
 ])
 def test_main_output(input_data, expected):